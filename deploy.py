@@ -4,11 +4,20 @@ Resume Analyzer Deployment Helper Script
 Prepares the application for various deployment scenarios
 """
 
+import importlib
 import os
+import site
 import subprocess
 import sys
 from pathlib import Path
 
+# spaCy model wheel installed by setup_environment() and the generated
+# Dockerfile; it requires spaCy 3.7.x, which the requirements files pin
+SPACY_MODEL_URL = (
+    "https://github.com/explosion/spacy-models/releases/download/"
+    "en_core_web_sm-3.7.1/en_core_web_sm-3.7.1-py3-none-any.whl"
+)
+
 def check_requirements():
     """Check if all required dependencies are available"""
     print("🔍 Checking requirements...")
@@ -36,11 +45,12 @@ def setup_environment():
     print("🛠️ Setting up environment...")
     
     try:
-        # Install requirements
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
-        
-        # Download spaCy model
-        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
+        # Install requirements and the spaCy model wheel in a single pip run
+        subprocess.run([
+            sys.executable, "-m", "pip", "install",
+            "--no-input", "--disable-pip-version-check",
+            "-r", "requirements.txt", SPACY_MODEL_URL
+        ], check=True)
         
         print("✅ Environment setup complete")
         return True
@@ -48,23 +58,49 @@ def setup_environment():
         print(f"❌ Error setting up environment: {e}")
         return False
 
-def test_local_deployment():
-    """Test the application locally"""
+def test_local_deployment(fresh_interpreter=False):
+    """Test the application locally
+    
+    Pass fresh_interpreter=True right after setup_environment() has installed
+    packages: modules imported before the install would otherwise be checked
+    at their old versions.
+    """
     print("🧪 Testing local deployment...")
     
     try:
-        # Run a quick import test
-        subprocess.run([
-            sys.executable, "-c", 
-            "import streamlit; from src.simple_resume_analyzer import ResumeAnalyzer; print('✅ Imports successful')"
-        ], check=True, cwd=".")
+        if fresh_interpreter:
+            # Run a quick import test in a new interpreter
+            subprocess.run([
+                sys.executable, "-c", 
+                "import streamlit; from src.simple_resume_analyzer import ResumeAnalyzer; print('✅ Imports successful')"
+            ], check=True, cwd=".")
+        else:
+            # Run a quick import test in-process; pick up a user site-packages
+            # directory created since startup and drop stale finder caches
+            site.addsitedir(site.getusersitepackages())
+            importlib.invalidate_caches()
+            importlib.import_module("streamlit")
+            importlib.import_module("src.simple_resume_analyzer")
+            print("✅ Imports successful")
         
         print("✅ Local deployment test passed")
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"❌ Local deployment test failed: {e}")
         return False
 
+def _write_many(files):
+    """Write several generated files with raw os-level writes (LF line endings on every platform)"""
+    for path, data in files.items():
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # os.write may write fewer bytes than requested; keep going until done
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
 def create_docker_files():
     """Create Docker deployment files"""
     print("🐳 Creating Docker files...")
@@ -82,8 +118,8 @@ RUN apt-get update && apt-get install -y \\
 COPY requirements-deployment.txt requirements.txt
 RUN pip install --no-cache-dir -r requirements.txt
 
-# Download spaCy model
-RUN python -m spacy download en_core_web_sm
+# Install the spaCy model pinned in deploy.py
+RUN pip install --no-cache-dir """ + SPACY_MODEL_URL + """
 
 # Copy application code
 COPY . .
@@ -113,11 +149,10 @@ test_data/
 sample_data/
 """
     
-    with open("Dockerfile", "w") as f:
-        f.write(dockerfile_content)
-    
-    with open(".dockerignore", "w") as f:
-        f.write(dockerignore_content)
+    _write_many({
+        "Dockerfile": dockerfile_content.encode(),
+        ".dockerignore": dockerignore_content.encode()
+    })
     
     print("✅ Docker files created")
 
@@ -160,13 +195,13 @@ def main():
         prepare_for_streamlit_cloud()
     elif choice == "2":
         if setup_environment():
-            test_local_deployment()
+            test_local_deployment(fresh_interpreter=True)
     elif choice == "3":
         create_docker_files()
         print("✅ Docker files created. Build with: docker build -t resume-analyzer .")
     elif choice == "4":
         setup_environment()
-        test_local_deployment()
+        test_local_deployment(fresh_interpreter=True)
         create_docker_files()
         prepare_for_streamlit_cloud()
     else:
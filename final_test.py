@@ -10,13 +10,22 @@ import traceback
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+# Shared simple analyzer, built on first use
+_analyzer = None
+
+def _get_analyzer():
+    """Return the shared simple analyzer, creating it on first call"""
+    global _analyzer
+    if _analyzer is None:
+        from simple_resume_analyzer import ResumeAnalyzer
+        _analyzer = ResumeAnalyzer()
+    return _analyzer
+
 def test_simple_analyzer_with_files():
     """Test the simple analyzer with actual file analysis"""
     print("🧪 Testing Simple Analyzer with File Analysis...")
     try:
-        from simple_resume_analyzer import ResumeAnalyzer
-        
-        analyzer = ResumeAnalyzer()
+        analyzer = _get_analyzer()
         
         # Create test files
         test_resume = "test_resume_simple.txt"
@@ -79,8 +88,7 @@ def test_webapp_compatibility():
     print("\n🧪 Testing Webapp Compatibility...")
     try:
         # Test simple analyzer interface
-        from simple_resume_analyzer import ResumeAnalyzer as SimpleAnalyzer
-        simple = SimpleAnalyzer()
+        simple = _get_analyzer()
         
         # Check if method exists
         if hasattr(simple, 'analyze_resume_for_job'):
@@ -115,9 +123,7 @@ def test_error_handling():
     """Test error handling doesn't cause NoneType errors"""
     print("\n🧪 Testing Error Handling...")
     try:
-        from simple_resume_analyzer import ResumeAnalyzer
-        
-        analyzer = ResumeAnalyzer()
+        analyzer = _get_analyzer()
         
         # Test with non-existent files
         result = analyzer.analyze_resume_for_job("nonexistent.txt", "alsonothere.txt")
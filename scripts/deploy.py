@@ -211,11 +211,11 @@ class DeploymentManager:
                 self.project_root / "data"
             ]
             
-            for test_dir in test_dirs:
-                test_dir.mkdir(exist_ok=True)
-                test_file = test_dir / "test_write.txt"
-                test_file.write_text("test")
-                test_file.unlink()
+            for test_dir in map(str, test_dirs):
+                os.makedirs(test_dir, exist_ok=True)
+                # Single access() probe instead of a write/unlink round-trip
+                if not os.access(test_dir, os.W_OK | os.R_OK):
+                    return False
             
             return True
         except Exception:
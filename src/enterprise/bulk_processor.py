@@ -427,29 +427,37 @@ class BulkProcessingEngine:
         }
         
         if job.status == JobStatus.COMPLETED and job.results:
-            # Calculate result statistics
-            successful_results = [r for r in job.results if 'error' not in r]
-            if successful_results:
-                scores = [
-                    r.get('analysis_results', {}).get('overall_score', 0) 
-                    for r in successful_results
-                ]
+            # Calculate result statistics in a single pass over the results
+            score_count = 0
+            score_sum = 0
+            max_score = None
+            min_score = None
+            decision_counts = {'HIRE': 0, 'INTERVIEW': 0, 'REJECT': 0}
+            
+            for r in job.results:
+                if 'error' in r:
+                    continue
+                
+                score = r.get('analysis_results', {}).get('overall_score', 0)
+                score_count += 1
+                score_sum += score
+                if max_score is None or score > max_score:
+                    max_score = score
+                if min_score is None or score < min_score:
+                    min_score = score
+                
+                decision = r.get('hiring_recommendation', {}).get('decision')
+                if decision in decision_counts:
+                    decision_counts[decision] += 1
+            
+            if score_count:
                 summary['result_statistics'] = {
-                    'average_score': sum(scores) / len(scores) if scores else 0,
-                    'max_score': max(scores) if scores else 0,
-                    'min_score': min(scores) if scores else 0,
-                    'hire_recommendations': len([
-                        r for r in successful_results 
-                        if r.get('hiring_recommendation', {}).get('decision') == 'HIRE'
-                    ]),
-                    'interview_recommendations': len([
-                        r for r in successful_results 
-                        if r.get('hiring_recommendation', {}).get('decision') == 'INTERVIEW'
-                    ]),
-                    'reject_recommendations': len([
-                        r for r in successful_results 
-                        if r.get('hiring_recommendation', {}).get('decision') == 'REJECT'
-                    ])
+                    'average_score': score_sum / score_count,
+                    'max_score': max_score,
+                    'min_score': min_score,
+                    'hire_recommendations': decision_counts['HIRE'],
+                    'interview_recommendations': decision_counts['INTERVIEW'],
+                    'reject_recommendations': decision_counts['REJECT']
                 }
         
         return summary
@@ -45,14 +45,16 @@ class BM25Scorer:
         self.corpus = [doc.lower().split() for doc in corpus]
         self.N = len(corpus)
         
-        # Calculate document frequencies and lengths
+        # Calculate term frequencies and lengths once per document, so
+        # scoring a query is just dictionary lookups
+        self.doc_freqs = [Counter(doc) for doc in self.corpus]
         self.doc_len = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_len) / self.N
         
         # Calculate document frequencies for each term
         df = defaultdict(int)
-        for doc in self.corpus:
-            for word in set(doc):
+        for doc_term_freqs in self.doc_freqs:
+            for word in doc_term_freqs:
                 df[word] += 1
         
         # Calculate IDF for each term
@@ -71,12 +73,14 @@ class BM25Scorer:
         Returns:
             BM25 score
         """
-        query_terms = query.lower().split()
-        doc = self.corpus[doc_idx]
+        return self._score_terms(query.lower().split(), doc_idx)
+    
+    def _score_terms(self, query_terms: List[str], doc_idx: int) -> float:
+        """Calculate BM25 score for already tokenized query terms"""
         doc_len = self.doc_len[doc_idx]
         
         score = 0
-        doc_term_freqs = Counter(doc)
+        doc_term_freqs = self.doc_freqs[doc_idx]
         
         for term in query_terms:
             if term in doc_term_freqs:
@@ -100,7 +104,9 @@ class BM25Scorer:
         Returns:
             List of scores for each document
         """
-        return [self.score(query, i) for i in range(self.N)]
+        # Tokenize the query once rather than once per document
+        query_terms = query.lower().split()
+        return [self._score_terms(query_terms, i) for i in range(self.N)]
     
     def rank_documents(self, query: str, top_k: int = None) -> List[Tuple[int, float]]:
         """
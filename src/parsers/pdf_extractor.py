@@ -20,12 +20,10 @@ class PDFExtractor:
     def extract_text_pymupdf(self, file_path: str) -> str:
         """Extract text using PyMuPDF (fitz)"""
         try:
-            text = ""
             doc = fitz.open(file_path)
             
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                text += page.get_text() + "\n"
+            # Collect page texts and join once instead of repeated concatenation
+            text = "\n".join(doc[page_num].get_text() for page_num in range(doc.page_count))
             
             doc.close()
             return text.strip()
@@ -37,14 +35,14 @@ class PDFExtractor:
     def extract_text_pdfplumber(self, file_path: str) -> str:
         """Extract text using pdfplumber"""
         try:
-            text = ""
+            page_texts = []
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        page_texts.append(page_text)
             
-            return text.strip()
+            return "\n".join(page_texts).strip()
         
         except Exception as e:
             logger.error(f"pdfplumber extraction failed for {file_path}: {str(e)}")
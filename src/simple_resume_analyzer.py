@@ -4,11 +4,15 @@ Only imports what's needed and defers heavy initialization
 """
 
 import os
+import ntpath
 import sys
+import hashlib
 from typing import Dict, Any, Optional
+from bisect import bisect_right
 from collections import Counter
+from functools import lru_cache
 import re
-import math
+import logging
 
 # Add src directory to path for absolute imports
 sys.path.append(os.path.join(os.path.dirname(__file__)))
@@ -20,6 +24,189 @@ except:
     def load_config(path=None):
         return {"api_keys": {"openai": "", "huggingface": ""}}
 
+logger = logging.getLogger(__name__)
+
+# Common technical skills keywords, grouped by area
+SKILL_PATTERNS = [
+    r'\b(?:python|java|javascript|c\+\+|c#|php|ruby|swift|kotlin|go|rust)\b',
+    r'\b(?:react|angular|vue|node|express|django|flask|spring|laravel)\b',
+    r'\b(?:sql|mysql|postgresql|mongodb|redis|elasticsearch)\b',
+    r'\b(?:aws|azure|gcp|docker|kubernetes|jenkins|git|github)\b',
+    r'\b(?:machine learning|deep learning|ai|data science|analytics)\b',
+    r'\b(?:html|css|bootstrap|tailwind|sass|scss)\b',
+    r'\b(?:tensorflow|pytorch|scikit-learn|pandas|numpy)\b',
+    r'\b(?:project management|agile|scrum|devops|ci/cd)\b'
+]
+
+# All skill groups fused into one pattern so the text is scanned once
+SKILLS_RE = re.compile('|'.join(SKILL_PATTERNS))
+
+# Punctuation and other non-word characters stripped by _clean_text
+NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# str.translate table for _clean_text's pure-ASCII fast path: lowercases and
+# blanks out exactly the characters NON_WORD_RE would replace
+ASCII_CLEAN_TABLE = {
+    code: ' ' if NON_WORD_RE.match(chr(code).lower()) else chr(code).lower()
+    for code in range(128)
+}
+
+# Common stop words ignored by _extract_keywords
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'among', 'within', 'without', 'upon', 'this', 'that',
+    'these', 'those', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+    'must', 'can', 'shall', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
+    'her', 'us', 'them', 'my', 'your', 'his', 'our', 'their'
+})
+
+# Important technical keywords weighted up by _calculate_keyword_score
+IMPORTANT_KEYWORDS = frozenset({
+    'python', 'django', 'flask', 'aws', 'docker', 'kubernetes', 'postgresql', 
+    'mongodb', 'react', 'javascript', 'git', 'api', 'development', 'experience',
+    'senior', 'lead', 'architect', 'microservices', 'scrum', 'agile'
+})
+
+# Critical skills that earn a bonus in _calculate_skill_score
+CRITICAL_SKILLS = frozenset({'python', 'django', 'flask', 'aws', 'docker', 'kubernetes', 'postgresql', 'react'})
+
+# Capitalized words that might be technologies (used on raw, uncleaned text)
+TECH_WORD_RE = re.compile(r'\b[A-Z][a-z]*(?:[A-Z][a-z]*)*\b')
+
+# Capitalized words that are never technologies
+TECH_WORD_STOP_WORDS = frozenset({'the', 'and', 'for', 'with', 'this', 'that'})
+
+# Experience phrases and technology combinations matched by _extract_phrases
+PHRASE_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    # Experience patterns
+    r'\d+\+?\s*years?\s+(?:of\s+)?(?:experience|work|background)',
+    r'(?:experience|background)\s+(?:in|with|of)\s+\w+',
+    r'(?:senior|junior|lead|principal)\s+\w+',
+    # Technology combinations
+    r'\w+\s+(?:development|programming|framework|platform)',
+    r'(?:web|mobile|full[\-\s]?stack|backend|frontend)\s+\w+',
+    r'\w+\s+(?:database|server|cloud|deployment)'
+])
+
+# Years-of-experience patterns used by _extract_years_experience. A singular
+# "N year experience" is already matched by the first pattern's "years?"
+YEARS_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:experience|work)',
+    r'(?:experience|work).*?(\d+)\+?\s*years?',
+])
+
+# Seniority indicator groups and their weights, used by _assess_seniority.
+# These are plain substring alternations (no word boundaries), so "lead"
+# also matches "leadership" just as a substring check would
+SENIORITY_PATTERNS = (
+    # Senior level indicators
+    (re.compile(r'senior|lead|principal|architect'), 3.0),
+    # Leadership indicators
+    (re.compile(r'led|managed|mentored|supervised'), 2.0),
+    # Advanced responsibility indicators
+    (re.compile(r'technical decisions|architecture|code review|best practices'), 1.5),
+    # Project scale indicators
+    (re.compile(r'microservices|scalable|enterprise|production'), 1.0),
+)
+
+# Component weights for the overall score, with more emphasis on skills
+# and experience
+KEYWORD_WEIGHT = 0.25
+SKILL_WEIGHT = 0.40
+CONTEXT_WEIGHT = 0.15
+EXPERIENCE_WEIGHT = 0.20
+
+# Lower score bounds of the fair, good and excellent match bands
+MATCH_LEVEL_THRESHOLDS = (45, 65, 80)
+
+# Match level for each band, indexed like SCORE_ASSESSMENTS
+MATCH_LEVELS = ("poor", "fair", "good", "excellent")
+
+# Qualitative assessment for each band, indexed by
+# bisect_right(MATCH_LEVEL_THRESHOLDS, score)
+SCORE_ASSESSMENTS = (
+    "Poor match - significant gaps in required qualifications.",
+    "Fair match but requires skill development.",
+    "Good match with minor gaps in some areas.",
+    "Excellent match with strong alignment across all criteria."
+)
+
+# Contact details and name-line patterns used by the resume metadata extractors
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+PHONE_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',
+    r'\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}'
+])
+
+# Words that mark a line as something other than a name (substring match)
+NON_NAME_LINE_RE = re.compile(r'resume|cv|curriculum|phone|email|@|address|objective|summary')
+
+NAME_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'^[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',  # First Middle Last
+    r'^[A-Z][a-z]+\s+[A-Z]\.?\s+[A-Z][a-z]+$',        # First M. Last
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',                   # First Last
+    r'^[A-Z]+\s+[A-Z]+$',                             # FIRST LAST
+    r'^[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+$',             # Mixed case
+])
+
+# Maximum number of extracted files kept by ResumeAnalyzer._read_file_content
+FILE_CONTENT_CACHE_SIZE = 64
+
+# Per-text feature extraction, cached because one job description is
+# usually scored against many resumes
+@lru_cache(maxsize=256)
+def _skills_for(text: str) -> frozenset:
+    """Extract technical skills from text"""
+    skills = set(SKILLS_RE.findall(text))
+    
+    # Also extract capitalized words that might be technologies
+    tech_words = TECH_WORD_RE.findall(text)
+    for word in tech_words:
+        if len(word) > 2 and word.lower() not in TECH_WORD_STOP_WORDS:
+            skills.add(word.lower())
+    
+    return frozenset(skills)
+
+@lru_cache(maxsize=256)
+def _phrases_for(text: str) -> tuple:
+    """Extract meaningful phrases from text"""
+    # Look for phrases like "3+ years experience", "project management", etc.
+    phrases = []
+    for pattern in PHRASE_PATTERNS:
+        phrases.extend(pattern.findall(text))
+    
+    return tuple(phrases)
+
+@lru_cache(maxsize=256)
+def _seniority_for(text: str) -> float:
+    """Assess seniority level from text content"""
+    text_lower = text.lower()
+    seniority_score = 0.0
+    
+    # One substring search per indicator group instead of one per word
+    for pattern, weight in SENIORITY_PATTERNS:
+        if pattern.search(text_lower):
+            seniority_score += weight
+    
+    return seniority_score
+
+@lru_cache(maxsize=256)
+def _years_for(text: str) -> int:
+    """Extract years of experience from text"""
+    years = []
+    for pattern in YEARS_PATTERNS:
+        for match in pattern.findall(text):
+            try:
+                years.append(int(match))
+            except ValueError:
+                continue
+    
+    return max(years) if years else None
+
 class ResumeAnalyzer:
     """
     Simplified Resume Analyzer for web application
@@ -39,7 +226,11 @@ class ResumeAnalyzer:
         self.scoring_engine = None
         self.llm_engine = None
         
-        print("Resume Analyzer initialized successfully (lightweight mode)")
+        # Extracted text keyed by file type and content hash, so a resume or
+        # job description analyzed repeatedly is only parsed once
+        self._file_content_cache = {}
+        
+        logger.info("Resume Analyzer initialized successfully (lightweight mode)")
     
     def _init_parser(self):
         """Initialize document parser on demand"""
@@ -48,7 +239,7 @@ class ResumeAnalyzer:
                 from parsers import DocumentParser
                 self.document_parser = DocumentParser()
             except Exception as e:
-                print(f"Warning: Could not initialize document parser: {e}")
+                logger.warning("Could not initialize document parser: %s", e)
                 self.document_parser = None
     
     def _init_scoring(self):
@@ -58,7 +249,7 @@ class ResumeAnalyzer:
                 from scoring import ScoringEngine
                 self.scoring_engine = ScoringEngine(self.config)
             except Exception as e:
-                print(f"Warning: Could not initialize scoring engine: {e}")
+                logger.warning("Could not initialize scoring engine: %s", e)
                 self.scoring_engine = None
     
     def analyze_resume(self, resume_text: str, job_text: str) -> Dict[str, Any]:
@@ -66,20 +257,39 @@ class ResumeAnalyzer:
         Analyze resume against job description with enhanced scoring
         """
         try:
-            import re
-            from collections import Counter
-            import math
-            
+            prepared_jd = self.prepare_jd(job_text)
+        except Exception as e:
+            return self._analysis_error(e)
+        
+        return self.analyze_with_prepared_jd(resume_text, prepared_jd)
+    
+    def prepare_jd(self, job_text: str) -> Dict[str, Any]:
+        """
+        Precompute the job description features used by analyze_with_prepared_jd,
+        so one job description can be scored against many resumes
+        """
+        job_clean = self._clean_text(job_text)
+        return {
+            "clean_text": job_clean,
+            "skills": self._extract_skills(job_clean),
+            "keywords": self._extract_keywords(job_clean)
+        }
+    
+    def analyze_with_prepared_jd(self, resume_text: str, prepared_jd: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze resume against a job description prepared with prepare_jd
+        """
+        try:
             # Clean and normalize text
             resume_clean = self._clean_text(resume_text)
-            job_clean = self._clean_text(job_text)
+            job_clean = prepared_jd["clean_text"]
             
             # Extract key information
             resume_skills = self._extract_skills(resume_clean)
-            job_skills = self._extract_skills(job_clean)
+            job_skills = prepared_jd["skills"]
             
             resume_keywords = self._extract_keywords(resume_clean)
-            job_keywords = self._extract_keywords(job_clean)
+            job_keywords = prepared_jd["keywords"]
             
             # Calculate different scoring components
             keyword_score = self._calculate_keyword_score(resume_keywords, job_keywords)
@@ -88,29 +298,15 @@ class ResumeAnalyzer:
             experience_score = self._calculate_experience_score(resume_clean, job_clean)
             
             # Weight the scores with more emphasis on skills and experience
-            weights = {
-                'keyword': 0.25,
-                'skill': 0.40,     # Increased weight for skills
-                'context': 0.15,
-                'experience': 0.20  # Increased weight for experience
-            }
-            
             overall_score = (
-                keyword_score * weights['keyword'] +
-                skill_score * weights['skill'] +
-                context_score * weights['context'] +
-                experience_score * weights['experience']
+                keyword_score * KEYWORD_WEIGHT +
+                skill_score * SKILL_WEIGHT +
+                context_score * CONTEXT_WEIGHT +
+                experience_score * EXPERIENCE_WEIGHT
             )
             
             # Determine match level based on score
-            if overall_score >= 80:
-                match_level = "excellent"
-            elif overall_score >= 65:
-                match_level = "good"
-            elif overall_score >= 45:
-                match_level = "fair"
-            else:
-                match_level = "poor"
+            match_level = MATCH_LEVELS[bisect_right(MATCH_LEVEL_THRESHOLDS, overall_score)]
             
             # Generate explanation
             explanation = self._generate_explanation(
@@ -136,80 +332,41 @@ class ResumeAnalyzer:
             }
             
         except Exception as e:
-            return {
-                "overall_score": 0,
-                "match_level": "error",
-                "explanation": f"Analysis failed: {e}",
-                "recommendations": ["Please check input data and try again"],
-                "component_scores": {
-                    "keyword_match": 0,
-                    "skill_match": 0,
-                    "context_match": 0,
-                    "experience_match": 0
-                }
+            return self._analysis_error(e)
+    
+    def _analysis_error(self, error: Exception) -> Dict[str, Any]:
+        """Build the result returned when text analysis fails"""
+        return {
+            "overall_score": 0,
+            "match_level": "error",
+            "explanation": f"Analysis failed: {error}",
+            "recommendations": ["Please check input data and try again"],
+            "component_scores": {
+                "keyword_match": 0,
+                "skill_match": 0,
+                "context_match": 0,
+                "experience_match": 0
             }
+        }
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for analysis"""
-        import re
-        # Convert to lowercase
-        text = text.lower()
-        # Remove extra whitespace and punctuation
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Lowercase and blank out punctuation, then collapse and trim
+        # whitespace with split/join instead of a second regex pass
+        if text.isascii():
+            # Single C-level pass for the common pure-ASCII case
+            return ' '.join(text.translate(ASCII_CLEAN_TABLE).split())
+        return ' '.join(NON_WORD_RE.sub(' ', text.lower()).split())
     
     def _extract_skills(self, text: str) -> set:
         """Extract technical skills from text"""
-        # Common technical skills keywords
-        skills_patterns = [
-            r'\b(?:python|java|javascript|c\+\+|c#|php|ruby|swift|kotlin|go|rust)\b',
-            r'\b(?:react|angular|vue|node|express|django|flask|spring|laravel)\b',
-            r'\b(?:sql|mysql|postgresql|mongodb|redis|elasticsearch)\b',
-            r'\b(?:aws|azure|gcp|docker|kubernetes|jenkins|git|github)\b',
-            r'\b(?:machine learning|deep learning|ai|data science|analytics)\b',
-            r'\b(?:html|css|bootstrap|tailwind|sass|scss)\b',
-            r'\b(?:tensorflow|pytorch|scikit-learn|pandas|numpy)\b',
-            r'\b(?:project management|agile|scrum|devops|ci/cd)\b'
-        ]
-        
-        skills = set()
-        for pattern in skills_patterns:
-            import re
-            matches = re.findall(pattern, text)
-            skills.update(matches)
-        
-        # Also extract capitalized words that might be technologies
-        import re
-        tech_words = re.findall(r'\b[A-Z][a-z]*(?:[A-Z][a-z]*)*\b', text)
-        for word in tech_words:
-            if len(word) > 2 and word.lower() not in ['the', 'and', 'for', 'with', 'this', 'that']:
-                skills.add(word.lower())
-        
-        return skills
+        # Copy so callers can't mutate the cached result
+        return set(_skills_for(text))
     
     def _extract_keywords(self, text: str) -> Counter:
         """Extract important keywords with frequency"""
-        from collections import Counter
-        import re
-        from collections import Counter
-        import re
-        
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'between', 'among', 'within', 'without', 'upon', 'this', 'that',
-            'these', 'those', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-            'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-            'must', 'can', 'shall', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
-            'her', 'us', 'them', 'my', 'your', 'his', 'our', 'their'
-        }
-        
-        words = text.split()
-        filtered_words = [word for word in words if len(word) > 2 and word not in stop_words]
-        
-        return Counter(filtered_words)
+        # Count words directly, skipping short words and common stop words
+        return Counter(word for word in text.split() if len(word) > 2 and word not in STOP_WORDS)
     
     def _calculate_keyword_score(self, resume_keywords: Counter, job_keywords: Counter) -> float:
         """Calculate keyword matching score using enhanced TF-IDF like approach"""
@@ -219,27 +376,24 @@ class ResumeAnalyzer:
         # Calculate overlap and weighted importance
         total_weight = 0
         matched_weight = 0
-        
-        # Important keywords get extra weight
-        important_keywords = {
-            'python', 'django', 'flask', 'aws', 'docker', 'kubernetes', 'postgresql', 
-            'mongodb', 'react', 'javascript', 'git', 'api', 'development', 'experience',
-            'senior', 'lead', 'architect', 'microservices', 'scrum', 'agile'
-        }
+        keyword_diversity = 0  # Job keywords that also appear in the resume
+        resume_get = resume_keywords.get
         
         for keyword, freq in job_keywords.items():
             # Base weight from frequency
             weight = freq
             
             # Boost weight for important technical keywords
-            if keyword in important_keywords:
+            if keyword in IMPORTANT_KEYWORDS:
                 weight *= 2.0
             
             total_weight += weight
             
-            if keyword in resume_keywords:
+            # Single lookup for both the membership test and the frequency
+            resume_freq = resume_get(keyword)
+            if resume_freq is not None:
                 # Bonus for frequency in resume
-                resume_freq = resume_keywords[keyword]
+                keyword_diversity += 1
                 match_strength = min(1.2, resume_freq / freq)  # Cap at 1.2 for bonus
                 matched_weight += weight * match_strength
         
@@ -249,7 +403,6 @@ class ResumeAnalyzer:
         base_score = (matched_weight / total_weight) * 100
         
         # Bonus for having many relevant keywords
-        keyword_diversity = len(set(resume_keywords.keys()).intersection(set(job_keywords.keys())))
         diversity_bonus = min(15.0, keyword_diversity * 2)  # Max 15 bonus
         
         return min(100.0, base_score + diversity_bonus)
@@ -260,19 +413,16 @@ class ResumeAnalyzer:
             return 50.0  # Neutral score if no skills detected
         
         matched_skills = resume_skills.intersection(job_skills)
-        
-        if len(job_skills) == 0:
-            return 50.0
+        job_skill_count = len(job_skills)  # Non-zero after the check above
         
         # Base skill match ratio
-        skill_match_ratio = len(matched_skills) / len(job_skills)
+        skill_match_ratio = len(matched_skills) / job_skill_count
         
         # Bonus for extra relevant skills (shows broader knowledge)
-        extra_skills_factor = min(1.2, len(resume_skills) / max(1, len(job_skills)))
+        extra_skills_factor = min(1.2, len(resume_skills) / job_skill_count)
         
         # Special bonuses for critical skills
-        critical_skills = {'python', 'django', 'flask', 'aws', 'docker', 'kubernetes', 'postgresql', 'react'}
-        critical_matches = len(critical_skills.intersection(matched_skills))
+        critical_matches = len(CRITICAL_SKILLS.intersection(matched_skills))
         critical_bonus = critical_matches * 5  # 5 points per critical skill
         
         base_score = skill_match_ratio * 70 * extra_skills_factor  # Adjusted base scoring
@@ -282,8 +432,6 @@ class ResumeAnalyzer:
     
     def _calculate_context_score(self, resume_text: str, job_text: str) -> float:
         """Calculate contextual similarity score"""
-        import re
-        
         # Extract multi-word phrases that indicate context
         job_phrases = self._extract_phrases(job_text)
         resume_phrases = self._extract_phrases(resume_text)
@@ -294,51 +442,32 @@ class ResumeAnalyzer:
         matched_phrases = 0
         total_phrases = len(job_phrases)
         
+        # Exact matches are a set lookup; each distinct job phrase is only
+        # compared against the resume phrases once
+        resume_phrase_set = set(resume_phrases)
+        phrase_matches = {}
+        
         for phrase in job_phrases:
-            # Check for exact or partial matches
-            for resume_phrase in resume_phrases:
-                if phrase in resume_phrase or resume_phrase in phrase:
-                    matched_phrases += 1
-                    break
+            matched = phrase_matches.get(phrase)
+            if matched is None:
+                # Check for exact or partial matches
+                matched = phrase in resume_phrase_set or any(
+                    phrase in resume_phrase or resume_phrase in phrase
+                    for resume_phrase in resume_phrases
+                )
+                phrase_matches[phrase] = matched
+            if matched:
+                matched_phrases += 1
         
         context_score = (matched_phrases / total_phrases) * 100 if total_phrases > 0 else 50.0
         return min(100.0, context_score)
     
     def _extract_phrases(self, text: str) -> list:
         """Extract meaningful phrases from text"""
-        import re
-        
-        # Look for phrases like "3+ years experience", "project management", etc.
-        phrases = []
-        
-        # Experience patterns
-        exp_patterns = [
-            r'\d+\+?\s*years?\s+(?:of\s+)?(?:experience|work|background)',
-            r'(?:experience|background)\s+(?:in|with|of)\s+\w+',
-            r'(?:senior|junior|lead|principal)\s+\w+'
-        ]
-        
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, text)
-            phrases.extend(matches)
-        
-        # Technology combinations
-        tech_patterns = [
-            r'\w+\s+(?:development|programming|framework|platform)',
-            r'(?:web|mobile|full[\-\s]?stack|backend|frontend)\s+\w+',
-            r'\w+\s+(?:database|server|cloud|deployment)'
-        ]
-        
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text)
-            phrases.extend(matches)
-        
-        return phrases
+        return list(_phrases_for(text))
     
     def _calculate_experience_score(self, resume_text: str, job_text: str) -> float:
         """Calculate experience level matching score with enhanced logic"""
-        import re
-        
         # Extract years of experience from both texts
         job_years = self._extract_years_experience(job_text)
         resume_years = self._extract_years_experience(resume_text)
@@ -377,70 +506,26 @@ class ResumeAnalyzer:
     
     def _assess_seniority(self, text: str) -> float:
         """Assess seniority level from text content"""
-        text_lower = text.lower()
-        seniority_score = 0.0
-        
-        # Senior level indicators
-        if any(word in text_lower for word in ['senior', 'lead', 'principal', 'architect']):
-            seniority_score += 3.0
-        
-        # Leadership indicators
-        if any(word in text_lower for word in ['led', 'managed', 'mentored', 'supervised']):
-            seniority_score += 2.0
-        
-        # Advanced responsibility indicators
-        if any(phrase in text_lower for phrase in ['technical decisions', 'architecture', 'code review', 'best practices']):
-            seniority_score += 1.5
-        
-        # Project scale indicators
-        if any(phrase in text_lower for phrase in ['microservices', 'scalable', 'enterprise', 'production']):
-            seniority_score += 1.0
-        
-        return seniority_score
+        return _seniority_for(text)
     
     def _extract_years_experience(self, text: str) -> int:
         """Extract years of experience from text"""
-        import re
-        
-        patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:experience|work)',
-            r'(?:experience|work).*?(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*year\s+(?:experience|work)',
-        ]
-        
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                try:
-                    years.append(int(match))
-                except ValueError:
-                    continue
-        
-        return max(years) if years else None
+        return _years_for(text)
     
     def _generate_explanation(self, overall_score: float, keyword_score: float, 
                             skill_score: float, context_score: float, experience_score: float) -> str:
         """Generate detailed explanation of the score"""
-        explanation = f"Overall match score: {overall_score:.1f}/100. "
-        
-        # Component breakdown
-        explanation += f"Breakdown: Keywords {keyword_score:.1f}%, "
-        explanation += f"Skills {skill_score:.1f}%, "
-        explanation += f"Context {context_score:.1f}%, "
-        explanation += f"Experience {experience_score:.1f}%. "
-        
-        # Qualitative assessment
-        if overall_score >= 80:
-            explanation += "Excellent match with strong alignment across all criteria."
-        elif overall_score >= 65:
-            explanation += "Good match with minor gaps in some areas."
-        elif overall_score >= 45:
-            explanation += "Fair match but requires skill development."
-        else:
-            explanation += "Poor match - significant gaps in required qualifications."
-        
-        return explanation
+        # Qualitative assessment picked by score band
+        assessment = SCORE_ASSESSMENTS[bisect_right(MATCH_LEVEL_THRESHOLDS, overall_score)]
+        
+        return (
+            f"Overall match score: {overall_score:.1f}/100. "
+            f"Breakdown: Keywords {keyword_score:.1f}%, "
+            f"Skills {skill_score:.1f}%, "
+            f"Context {context_score:.1f}%, "
+            f"Experience {experience_score:.1f}%. "
+            f"{assessment}"
+        )
     
     def _generate_recommendations(self, keyword_score: float, skill_score: float, 
                                 context_score: float, experience_score: float,
@@ -516,17 +601,31 @@ Recommendations:
             if not job_text.strip():
                 raise ValueError("Job description file appears to be empty or unreadable")
             
-            # Perform enhanced analysis
-            analysis_result = self.analyze_resume(resume_text, job_text)
+            # Perform enhanced analysis, keeping the prepared job description
+            # so its skills aren't extracted a second time below
+            prepared_jd = self.prepare_jd(job_text)
+            analysis_result = self.analyze_with_prepared_jd(resume_text, prepared_jd)
             
             # Extract additional metadata for better analysis
             candidate_name = self._extract_candidate_name(resume_text)
             email = self._extract_email(resume_text)
             phone = self._extract_phone(resume_text)
             
+            # File names for the report; ntpath accepts both / and \ separators
+            resume_filename = ntpath.basename(resume_file_path)
+            job_filename = ntpath.basename(job_description_file_path)
+            
             # Generate hiring recommendation
             hiring_decision = self._determine_hiring_decision(analysis_result['overall_score'])
             
+            # Look up the analysis fields once for the result below
+            overall_score = analysis_result.get('overall_score', 0)
+            explanation = analysis_result.get('explanation', '')
+            recommendations = analysis_result.get('recommendations', [])
+            component_scores = analysis_result.get('component_scores', {})
+            keyword_match = component_scores.get('keyword_match', 0)
+            context_match = component_scores.get('context_match', 0)
+            
             # Format result to match full analyzer output
             return {
                 'metadata': {
@@ -543,55 +642,55 @@ Recommendations:
                     'phone': phone,
                     'skills': list(self._extract_skills(self._clean_text(resume_text))),
                     'experience_years': self._extract_years_experience(resume_text),
-                    'filename': resume_file_path.split('\\')[-1] if '\\' in resume_file_path else resume_file_path.split('/')[-1]
+                    'filename': resume_filename
                 },
                 'job_data': {
                     'title': self._extract_job_title(job_text),
                     'company': self._extract_company_name(job_text),
-                    'required_skills': list(self._extract_skills(self._clean_text(job_text))),
-                    'filename': job_description_file_path.split('\\')[-1] if '\\' in job_description_file_path else job_description_file_path.split('/')[-1]
+                    'required_skills': list(prepared_jd["skills"]),
+                    'filename': job_filename
                 },
                 'analysis_results': {
-                    'overall_score': analysis_result.get('overall_score', 0),
+                    'overall_score': overall_score,
                     'match_level': analysis_result.get('match_level', 'poor'),
-                    'confidence': min(90.0, analysis_result.get('overall_score', 0) * 0.8 + 20),  # Dynamic confidence based on score
-                    'explanation': analysis_result.get('explanation', ''),
-                    'recommendations': analysis_result.get('recommendations', []),
+                    'confidence': min(90.0, overall_score * 0.8 + 20),  # Dynamic confidence based on score
+                    'explanation': explanation,
+                    'recommendations': recommendations,
                     'risk_factors': self._identify_risk_factors(analysis_result)
                 },
                 'detailed_results': {
                     'hard_matching': {
-                        'overall_score': analysis_result.get('component_scores', {}).get('keyword_match', 0),
-                        'keyword_score': analysis_result.get('component_scores', {}).get('keyword_match', 0),
-                        'skills_score': analysis_result.get('component_scores', {}).get('skill_match', 0)
+                        'overall_score': keyword_match,
+                        'keyword_score': keyword_match,
+                        'skills_score': component_scores.get('skill_match', 0)
                     },
                     'soft_matching': {
-                        'combined_semantic_score': analysis_result.get('component_scores', {}).get('context_match', 0),
-                        'semantic_score': analysis_result.get('component_scores', {}).get('context_match', 0),
-                        'embedding_score': analysis_result.get('component_scores', {}).get('context_match', 0)
+                        'combined_semantic_score': context_match,
+                        'semantic_score': context_match,
+                        'embedding_score': context_match
                     },
                     'llm_analysis': {
-                        'llm_score': analysis_result.get('component_scores', {}).get('experience_match', 0),
-                        'llm_verdict': 'good' if analysis_result.get('overall_score', 0) > 60 else 'medium' if analysis_result.get('overall_score', 0) > 30 else 'poor',
+                        'llm_score': component_scores.get('experience_match', 0),
+                        'llm_verdict': 'good' if overall_score > 60 else 'medium' if overall_score > 30 else 'poor',
                         'gap_analysis': {
-                            'detailed_analysis': analysis_result.get('explanation', ''),
+                            'detailed_analysis': explanation,
                             'strengths': self._extract_strengths(analysis_result),
                             'weaknesses': self._extract_weaknesses(analysis_result)
                         },
-                        'personalized_feedback': analysis_result.get('explanation', ''),
-                        'improvement_suggestions': analysis_result.get('recommendations', [])
+                        'personalized_feedback': explanation,
+                        'improvement_suggestions': recommendations
                     },
                     'scoring_details': {
-                        'component_scores': analysis_result.get('component_scores', {}),
-                        'weighted_scores': analysis_result.get('component_scores', {})
+                        'component_scores': component_scores,
+                        'weighted_scores': component_scores
                     }
                 },
                 'hiring_recommendation': {
                     'decision': hiring_decision['decision'],
                     'confidence': hiring_decision['confidence'],
                     'reasoning': hiring_decision['reasoning'],
-                    'next_steps': analysis_result.get('recommendations', []),
-                    'success_probability': min(95.0, analysis_result.get('overall_score', 0) * 0.9 + 5)
+                    'next_steps': recommendations,
+                    'success_probability': min(95.0, overall_score * 0.9 + 5)
                 }
             }
             
@@ -630,6 +729,33 @@ Recommendations:
             }
     
     def _read_file_content(self, file_path: str) -> str:
+        """Read file content, reusing the text of PDF/DOCX files already extracted"""
+        file_extension = file_path.lower().split('.')[-1]
+        if file_extension not in ('pdf', 'docx', 'doc'):
+            # Plain text decodes about as fast as it hashes, so skip the cache
+            return self._extract_file_content(file_path)
+        
+        try:
+            with open(file_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).digest()
+        except OSError:
+            # Let the readers report missing or unreadable files
+            return self._extract_file_content(file_path)
+        
+        # Keyed by content rather than path, since the web app re-saves each
+        # upload to a fresh temp file; the extension selects the reader
+        cache_key = (file_extension, digest)
+        content = self._file_content_cache.get(cache_key)
+        if content is None:
+            content = self._extract_file_content(file_path)
+            if len(self._file_content_cache) >= FILE_CONTENT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._file_content_cache[next(iter(self._file_content_cache))]
+            self._file_content_cache[cache_key] = content
+        
+        return content
+    
+    def _extract_file_content(self, file_path: str) -> str:
         """Read file content from various formats (TXT, PDF, DOCX)"""
         file_extension = file_path.lower().split('.')[-1]
         
@@ -643,45 +769,59 @@ Recommendations:
                 return self._read_text_content(file_path)
         except Exception as e:
             # Fallback to text reading
-            print(f"Warning: Failed to read {file_extension} file, trying as text: {e}")
+            logger.warning("Failed to read %s file, trying as text: %s", file_extension, e)
             return self._read_text_content(file_path)
     
     def _read_text_content(self, file_path: str) -> str:
         """Read text file with various encoding attempts"""
         encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
         
+        # Read the file once and try the encodings in memory
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            raise ValueError(f"Unable to read file: {e}")
+        
         for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
+                text = data.decode(encoding)
+                break
             except UnicodeDecodeError:
                 continue
-            except Exception as e:
-                print(f"Error reading file with {encoding}: {e}")
-                continue
+        else:
+            # Last resort - decode with errors ignored
+            text = data.decode('utf-8', errors='ignore')
         
-        # Last resort - read with errors ignored
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
-        except Exception as e:
-            raise ValueError(f"Unable to read file: {e}")
+        # Match text-mode reads, which translate \r\n and \r to \n
+        return text.replace('\r\n', '\n').replace('\r', '\n')
     
     def _read_pdf_content(self, file_path: str) -> str:
-        """Simple PDF text extraction"""
+        """Simple PDF text extraction, preferring PyMuPDF over PyPDF2"""
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            fitz = None
+        
+        if fitz is not None:
+            try:
+                # C-backed extraction, typically several times faster than PyPDF2
+                with fitz.open(file_path) as doc:
+                    return "".join(page.get_text() + "\n" for page in doc)
+            except Exception as e:
+                logger.warning("PyMuPDF reading failed, trying PyPDF2: %s", e)
+        
         try:
             import PyPDF2
-            text = ""
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
+                # Join once instead of growing a string page by page
+                return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
         except ImportError:
-            print("PyPDF2 not available, treating PDF as text file")
+            logger.warning("PyPDF2 not available, treating PDF as text file")
             return self._read_text_content(file_path)
         except Exception as e:
-            print(f"PDF reading failed, treating as text: {e}")
+            logger.warning("PDF reading failed, treating as text: %s", e)
             return self._read_text_content(file_path)
     
     def _read_docx_content(self, file_path: str) -> str:
@@ -689,43 +829,30 @@ Recommendations:
         try:
             import docx
             doc = docx.Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         except ImportError:
-            print("python-docx not available, treating DOCX as text file")
+            logger.warning("python-docx not available, treating DOCX as text file")
             return self._read_text_content(file_path)
         except Exception as e:
-            print(f"DOCX reading failed, treating as text: {e}")
+            logger.warning("DOCX reading failed, treating as text: %s", e)
             return self._read_text_content(file_path)
     
     def _extract_candidate_name(self, resume_text: str) -> str:
         """Extract candidate name from resume"""
-        import re
-        lines = resume_text.split('\n')[:10]  # Check first 10 lines
-        
-        # Enhanced name patterns
-        name_patterns = [
-            r'^[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',  # First Middle Last
-            r'^[A-Z][a-z]+\s+[A-Z]\.?\s+[A-Z][a-z]+$',        # First M. Last
-            r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',                   # First Last
-            r'^[A-Z]+\s+[A-Z]+$',                             # FIRST LAST
-            r'^[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+$',             # Mixed case
-        ]
+        lines = resume_text.split('\n', 10)[:10]  # Check first 10 lines, without splitting the rest
         
         for line in lines:
             line = line.strip()
             # Skip empty lines, very long lines, and lines with common non-name words
             if (not line or len(line) > 50 or 
-                any(word in line.lower() for word in ['resume', 'cv', 'curriculum', 'phone', 'email', '@', 'address', 'objective', 'summary'])):
+                NON_NAME_LINE_RE.search(line.lower())):
                 continue
                 
             # Check if line matches name patterns
             words = line.split()
             if 2 <= len(words) <= 4:  # Names typically 2-4 words
-                for pattern in name_patterns:
-                    if re.match(pattern, line):
+                for pattern in NAME_PATTERNS:
+                    if pattern.match(line):
                         return line
                         
                 # Fallback: check if line contains mostly alphabetic characters
@@ -754,30 +881,22 @@ Recommendations:
     
     def _extract_email(self, resume_text: str) -> str:
         """Extract email from resume"""
-        import re
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, resume_text)
-        return emails[0] if emails else "Not found"
+        # Only the first address is used, so stop scanning at it
+        match = EMAIL_RE.search(resume_text)
+        return match.group(0) if match else "Not found"
     
     def _extract_phone(self, resume_text: str) -> str:
         """Extract phone number from resume"""
-        import re
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',
-            r'\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}'
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, resume_text)
-            if phones:
-                return phones[0]
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(resume_text)
+            if match:
+                return match.group(0)
         
         return "Not found"
     
     def _extract_job_title(self, job_text: str) -> str:
         """Extract job title from job description"""
-        lines = job_text.split('\n')[:10]  # Check first 10 lines
+        lines = job_text.split('\n', 10)[:10]  # Check first 10 lines
         
         for line in lines:
             line = line.strip()
@@ -790,7 +909,7 @@ Recommendations:
     
     def _extract_company_name(self, job_text: str) -> str:
         """Extract company name from job description"""
-        lines = job_text.split('\n')[:15]  # Check first 15 lines
+        lines = job_text.split('\n', 15)[:15]  # Check first 15 lines
         
         for line in lines:
             line = line.strip()
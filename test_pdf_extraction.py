@@ -4,6 +4,7 @@ Test PDF extraction and candidate info extraction from Resumes folder
 
 import sys
 import os
+from itertools import islice
 from pathlib import Path
 
 # Add src directory to path
@@ -18,7 +19,7 @@ def test_pdf_extraction():
         
         # Test with actual PDF files from Resumes folder
         resumes_dir = Path("sample_data/resumes/Resumes")
-        pdf_files = list(resumes_dir.glob("*.pdf"))[:3]  # Test first 3 files
+        pdf_files = list(islice(resumes_dir.glob("*.pdf"), 3))  # Test first 3 files
         
         print("🧪 Testing PDF Extraction from Resumes folder:")
         print("=" * 50)
@@ -6,18 +6,22 @@ Main user interface for students and placement team
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import time
-import io
 import json
 from pathlib import Path
 import sys
 import os
 
-# Add src and project root directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# Add src and project root directory to path for imports. Streamlit re-runs
+# this script on every interaction, so skip entries that are already present
+for import_path in (os.path.join(os.path.dirname(__file__), '..', 'src'),
+                    os.path.join(os.path.dirname(__file__), '..')):
+    if import_path not in sys.path:
+        sys.path.append(import_path)
+
+# Directory where uploaded files are stored during analysis
+TEMP_UPLOAD_DIR = Path("temp_uploads")
 
 # Try to import config first
 try:
@@ -2057,12 +2061,17 @@ def show_system_status():
 
 def save_uploaded_file(uploaded_file, prefix):
     """Save uploaded file temporarily and return path"""
-    temp_dir = Path("temp_uploads")
-    temp_dir.mkdir(exist_ok=True)
-    
-    file_path = temp_dir / f"{prefix}_{uploaded_file.name}"
+    file_path = TEMP_UPLOAD_DIR / f"{prefix}_{uploaded_file.name}"
     
-    with open(file_path, "wb") as f:
+    try:
+        f = open(file_path, "wb")
+    except FileNotFoundError:
+        # Only create the upload directory when it is actually missing,
+        # instead of issuing a mkdir for every uploaded file
+        TEMP_UPLOAD_DIR.mkdir(exist_ok=True)
+        f = open(file_path, "wb")
+    
+    with f:
         f.write(uploaded_file.getbuffer())
     
     return str(file_path)
@@ -111,49 +111,45 @@ def test_webapp_end_to_end():
         traceback.print_exc()
         return False
 
+def _check_analyzer_method():
+    """Simple analyzer has required method"""
+    # A class-level check; no second analyzer instance is needed
+    from simple_resume_analyzer import ResumeAnalyzer
+    return hasattr(ResumeAnalyzer, 'analyze_resume_for_job')
+
+def _check_config_loading():
+    """Config loading works"""
+    from config.settings import load_config
+    return load_config() is not None
+
+def _check_webapp_imports():
+    """No import errors in webapp components"""
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'web_app'))
+    
+    # Key webapp components should import without error
+    return True
+
+# Readiness checks run in order by check_webapp_readiness
+READINESS_CHECKS = (
+    ("Simple analyzer method", _check_analyzer_method),
+    ("Config loading", _check_config_loading),
+    ("Webapp imports", _check_webapp_imports),
+)
+
 def check_webapp_readiness():
     """Final check that webapp is ready to run"""
     print("\n🔍 Checking Webapp Readiness...")
     
-    checks = []
-    
-    # Check 1: Simple analyzer has required method
-    try:
-        from simple_resume_analyzer import ResumeAnalyzer
-        analyzer = ResumeAnalyzer()
-        has_method = hasattr(analyzer, 'analyze_resume_for_job')
-        checks.append(("Simple analyzer method", has_method))
-        print(f"   Simple analyzer method: {'✅' if has_method else '❌'}")
-    except Exception as e:
-        checks.append(("Simple analyzer method", False))
-        print(f"   Simple analyzer method: ❌ ({e})")
-    
-    # Check 2: Config loading works
-    try:
-        from config.settings import load_config
-        config = load_config()
-        config_works = config is not None
-        checks.append(("Config loading", config_works))
-        print(f"   Config loading: {'✅' if config_works else '❌'}")
-    except Exception as e:
-        checks.append(("Config loading", False))
-        print(f"   Config loading: ❌ ({e})")
-    
-    # Check 3: No import errors in webapp components
-    try:
-        import sys
-        import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), 'web_app'))
-        
-        # Key webapp components should import without error
-        webapp_works = True
-        checks.append(("Webapp imports", webapp_works))
-        print(f"   Webapp imports: ✅")
-    except Exception as e:
-        checks.append(("Webapp imports", False))
-        print(f"   Webapp imports: ❌ ({e})")
+    all_passed = True
+    for check_name, check_func in READINESS_CHECKS:
+        try:
+            passed = bool(check_func())
+            print(f"   {check_name}: {'✅' if passed else '❌'}")
+        except Exception as e:
+            passed = False
+            print(f"   {check_name}: ❌ ({e})")
+        all_passed = all_passed and passed
     
-    all_passed = all(check[1] for check in checks)
     return all_passed
 
 if __name__ == "__main__":